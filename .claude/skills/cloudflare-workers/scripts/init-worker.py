@@ -11,11 +11,14 @@ Examples:
 """
 
 import argparse
+import re
 import subprocess
 import sys
 from pathlib import Path
 
 
+# Templates are filled in by render(), which replaces each {key} it is given;
+# any other braces are copied through as-is.
 WRANGLER_TEMPLATE = '''name = "{name}"
 main = "src/index.ts"
 compatibility_date = "2024-01-01"
@@ -43,28 +46,28 @@ binding = "BUCKET"
 bucket_name = "{name}-bucket"
 '''
 
-INDEX_TS = '''import {{ Hono }} from 'hono';
-import {{ cors }} from 'hono/cors';
+INDEX_TS = '''import { Hono } from 'hono';
+import { cors } from 'hono/cors';
 
-interface Env {{
+interface Env {
   ENVIRONMENT: string;
 {env_types}
-}}
+}
 
-const app = new Hono<{{ Bindings: Env }}>();
+const app = new Hono<{ Bindings: Env }>();
 
 app.use('*', cors());
 
-app.get('/', (c) => {{
-  return c.json({{
+app.get('/', (c) => {
+  return c.json({
     message: 'Hello from {name}!',
     environment: c.env.ENVIRONMENT,
-  }});
-}});
+  });
+});
 
-app.get('/health', (c) => {{
-  return c.json({{ status: 'ok' }});
-}});
+app.get('/health', (c) => {
+  return c.json({ status: 'ok' });
+});
 
 export default app;
 '''
@@ -86,6 +89,24 @@ def run_command(cmd: list[str], cwd: Path | None = None) -> bool:
         return False
 
 
+PLACEHOLDER_RE = re.compile(r'\{(\w+)\}')
+
+
+def render(template: str, **values: str) -> str:
+    """Fill {key} placeholders in a template with the given values.
+
+    Substitution is a single pass, so braces inside a value are never
+    themselves treated as placeholders.
+    """
+    return PLACEHOLDER_RE.sub(lambda m: values.get(m[1], m[0]), template)
+
+
+def write_files(project_path: Path, files: dict[str, str]) -> None:
+    """Write a batch of files, keyed by path relative to the project."""
+    for relative_path, content in files.items():
+        (project_path / relative_path).write_text(content)
+
+
 def create_project(name: str, with_d1: bool, with_kv: bool, with_r2: bool) -> bool:
     """Create a new Cloudflare Worker project."""
     project_path = Path(name)
@@ -95,65 +116,63 @@ def create_project(name: str, with_d1: bool, with_kv: bool, with_r2: bool) -> bo
         return False
 
     # Create directory structure
+    subdirs = ['src', 'test']
+    if with_d1:
+        subdirs.append('migrations')
+
     project_path.mkdir()
-    (project_path / 'src').mkdir()
-    (project_path / 'test').mkdir()
+    for subdir in subdirs:
+        (project_path / subdir).mkdir()
 
     # Build bindings configuration
     bindings = []
     env_types = []
 
     if with_d1:
-        bindings.append(D1_BINDING.format(name=name))
+        bindings.append(render(D1_BINDING, name=name))
         env_types.append(ENV_TYPES['d1'])
-        (project_path / 'migrations').mkdir()
 
     if with_kv:
         bindings.append(KV_BINDING)
         env_types.append(ENV_TYPES['kv'])
 
     if with_r2:
-        bindings.append(R2_BINDING.format(name=name))
+        bindings.append(render(R2_BINDING, name=name))
         env_types.append(ENV_TYPES['r2'])
 
-    # Write wrangler.toml
-    wrangler_content = WRANGLER_TEMPLATE.format(
+    wrangler_content = render(
+        WRANGLER_TEMPLATE,
         name=name,
         bindings='\n'.join(bindings)
     )
-    (project_path / 'wrangler.toml').write_text(wrangler_content)
 
-    # Write src/index.ts
-    index_content = INDEX_TS.format(
+    index_content = render(
+        INDEX_TS,
         name=name,
         env_types='\n'.join(env_types) if env_types else '  // Add bindings here'
     )
-    (project_path / 'src' / 'index.ts').write_text(index_content)
 
-    # Write package.json
-    package_json = f'''{{
+    package_json = render('''{
   "name": "{name}",
   "version": "0.1.0",
   "private": true,
-  "scripts": {{
+  "scripts": {
     "dev": "wrangler dev",
     "deploy": "wrangler deploy",
     "test": "vitest"
-  }},
-  "dependencies": {{
+  },
+  "dependencies": {
     "hono": "^4.0.0"
-  }},
-  "devDependencies": {{
+  },
+  "devDependencies": {
     "@cloudflare/workers-types": "^4.0.0",
     "typescript": "^5.0.0",
     "vitest": "^1.0.0",
     "wrangler": "^3.0.0"
-  }}
-}}
-'''
-    (project_path / 'package.json').write_text(package_json)
+  }
+}
+''', name=name)
 
-    # Write tsconfig.json
     tsconfig = '''{
   "compilerOptions": {
     "target": "ES2022",
@@ -169,33 +188,41 @@ def create_project(name: str, with_d1: bool, with_kv: bool, with_r2: bool) -> bo
   "exclude": ["node_modules"]
 }
 '''
-    (project_path / 'tsconfig.json').write_text(tsconfig)
 
-    # Write .gitignore
     gitignore = '''node_modules/
 dist/
 .wrangler/
 .dev.vars
 '''
-    (project_path / '.gitignore').write_text(gitignore)
 
-    print(f"\n✅ Created Cloudflare Worker project: {name}")
-    print(f"\nNext steps:")
-    print(f"  cd {name}")
-    print(f"  npm install")
+    write_files(project_path, {
+        'wrangler.toml': wrangler_content,
+        'src/index.ts': index_content,
+        'package.json': package_json,
+        'tsconfig.json': tsconfig,
+        '.gitignore': gitignore,
+    })
+
+    lines = [
+        f"\n✅ Created Cloudflare Worker project: {name}",
+        "\nNext steps:",
+        f"  cd {name}",
+        "  npm install",
+    ]
 
     if with_d1:
-        print(f"  wrangler d1 create {name}-db")
-        print(f"  # Update wrangler.toml with database_id")
+        lines.append(f"  wrangler d1 create {name}-db")
+        lines.append("  # Update wrangler.toml with database_id")
 
     if with_kv:
-        print(f"  wrangler kv:namespace create KV")
-        print(f"  # Update wrangler.toml with namespace id")
+        lines.append("  wrangler kv:namespace create KV")
+        lines.append("  # Update wrangler.toml with namespace id")
 
     if with_r2:
-        print(f"  wrangler r2 bucket create {name}-bucket")
+        lines.append(f"  wrangler r2 bucket create {name}-bucket")
 
-    print(f"  npm run dev")
+    lines.append("  npm run dev")
+    sys.stdout.write('\n'.join(lines) + '\n')
 
     return True
 
@@ -12,10 +12,13 @@ Examples:
 """
 
 import argparse
+import functools
 import sys
 from pathlib import Path
 
 
+# Templates are filled in by render(), which replaces each literal {name};
+# any other braces are copied through as-is.
 ACTION_YML_TS = '''name: '{name}'
 description: 'Description of what this action does'
 author: 'Your Name'
@@ -28,7 +31,7 @@ inputs:
   token:
     description: 'GitHub token'
     required: true
-    default: ${{{{ github.token }}}}
+    default: ${{ github.token }}
 
 outputs:
   result:
@@ -69,7 +72,7 @@ inputs:
 outputs:
   result:
     description: 'Action result'
-    value: ${{{{ steps.run.outputs.result }}}}
+    value: ${{ steps.run.outputs.result }}
 
 runs:
   using: 'composite'
@@ -77,7 +80,7 @@ runs:
     - id: run
       run: echo "result=success" >> $GITHUB_OUTPUT
       shell: bash
-      working-directory: ${{{{ inputs.working-directory }}}}
+      working-directory: ${{ inputs.working-directory }}
 '''
 
 MAIN_TS = '''import * as core from '@actions/core';
@@ -125,7 +128,7 @@ describe('action', () => {
 '''
 
 PACKAGE_JSON = '''{
-  "name": "%s",
+  "name": "{name}",
   "version": "1.0.0",
   "description": "GitHub Action",
   "main": "dist/index.js",
@@ -228,14 +231,14 @@ Description of what this action does.
 ```yaml
 - uses: owner/{name}@v1
   with:
-    token: ${{{{ secrets.GITHUB_TOKEN }}}}
+    token: ${{ secrets.GITHUB_TOKEN }}
 ```
 
 ## Inputs
 
 | Input | Description | Required | Default |
 |-------|-------------|----------|---------|
-| `token` | GitHub token | Yes | `${{{{ github.token }}}}` |
+| `token` | GitHub token | Yes | `${{ github.token }}` |
 
 ## Outputs
 
@@ -257,6 +260,18 @@ MIT
 '''
 
 
+@functools.lru_cache(maxsize=128)
+def render(template: str, name: str) -> str:
+    """Fill the action name into a template, caching the result."""
+    return template.replace('{name}', name)
+
+
+def write_files(project_path: Path, files: dict[str, str]) -> None:
+    """Write a batch of files, keyed by path relative to the project."""
+    for relative_path, content in files.items():
+        (project_path / relative_path).write_text(content)
+
+
 def create_typescript_action(name: str, project_path: Path) -> None:
     """Create a TypeScript-based action."""
     # Create directories
@@ -264,34 +279,38 @@ def create_typescript_action(name: str, project_path: Path) -> None:
     (project_path / '__tests__').mkdir()
     (project_path / 'dist').mkdir()
 
-    # Write files
-    (project_path / 'action.yml').write_text(ACTION_YML_TS.format(name=name))
-    (project_path / 'src' / 'main.ts').write_text(MAIN_TS)
-    (project_path / '__tests__' / 'main.test.ts').write_text(MAIN_TEST_TS)
-    (project_path / 'package.json').write_text(PACKAGE_JSON % name)
-    (project_path / 'tsconfig.json').write_text(TSCONFIG_JSON)
-    (project_path / 'jest.config.js').write_text(JEST_CONFIG)
-    (project_path / '.gitignore').write_text(GITIGNORE)
-    (project_path / 'README.md').write_text(README_MD.format(name=name))
-
-    # Create placeholder dist/index.js
-    (project_path / 'dist' / 'index.js').write_text('// Run npm run build to generate\n')
+    write_files(project_path, {
+        'action.yml': render(ACTION_YML_TS, name),
+        'src/main.ts': MAIN_TS,
+        '__tests__/main.test.ts': MAIN_TEST_TS,
+        'package.json': render(PACKAGE_JSON, name),
+        'tsconfig.json': TSCONFIG_JSON,
+        'jest.config.js': JEST_CONFIG,
+        '.gitignore': GITIGNORE,
+        'README.md': render(README_MD, name),
+        # Placeholder until the first build
+        'dist/index.js': '// Run npm run build to generate\n',
+    })
 
 
 def create_docker_action(name: str, project_path: Path) -> None:
     """Create a Docker-based action."""
-    (project_path / 'action.yml').write_text(ACTION_YML_DOCKER.format(name=name))
-    (project_path / 'Dockerfile').write_text(DOCKERFILE)
-    (project_path / 'entrypoint.sh').write_text(ENTRYPOINT_SH)
-    (project_path / '.gitignore').write_text(GITIGNORE)
-    (project_path / 'README.md').write_text(README_MD.format(name=name))
+    write_files(project_path, {
+        'action.yml': render(ACTION_YML_DOCKER, name),
+        'Dockerfile': DOCKERFILE,
+        'entrypoint.sh': ENTRYPOINT_SH,
+        '.gitignore': GITIGNORE,
+        'README.md': render(README_MD, name),
+    })
 
 
 def create_composite_action(name: str, project_path: Path) -> None:
     """Create a composite action."""
-    (project_path / 'action.yml').write_text(ACTION_YML_COMPOSITE.format(name=name))
-    (project_path / '.gitignore').write_text(GITIGNORE)
-    (project_path / 'README.md').write_text(README_MD.format(name=name))
+    write_files(project_path, {
+        'action.yml': render(ACTION_YML_COMPOSITE, name),
+        '.gitignore': GITIGNORE,
+        'README.md': render(README_MD, name),
+    })
 
 
 def main() -> int:
@@ -326,17 +345,20 @@ def main() -> int:
         create_typescript_action(args.name, project_path)
         action_type = "TypeScript"
 
-    print(f"\n✅ Created {action_type} action: {args.name}")
-    print(f"\nNext steps:")
-    print(f"  cd {args.name}")
+    lines = [
+        f"\n✅ Created {action_type} action: {args.name}",
+        "\nNext steps:",
+        f"  cd {args.name}",
+    ]
 
     if not args.docker and not args.composite:
-        print("  npm install")
-        print("  npm run build")
-        print("  npm test")
+        lines.append("  npm install")
+        lines.append("  npm run build")
+        lines.append("  npm test")
 
-    print(f"\nTo test locally:")
-    print(f"  act -j test")
+    lines.append("\nTo test locally:")
+    lines.append("  act -j test")
+    sys.stdout.write('\n'.join(lines) + '\n')
 
     return 0
 
@@ -11,24 +11,88 @@ Arguments:
     path        Directory or file to analyze (default: current directory)
     --strict    Flag any usage of 'any' as an error
     --report    Generate detailed markdown report
+    --json      Output as JSON (serialized with orjson when it is installed)
 """
 
+from __future__ import annotations
+
 import argparse
 import json
+import mmap
+import os
 import re
 import sys
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import NamedTuple
+from typing import TextIO
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
+@dataclass
+class TypeIssue:
+    # Explicit slots rather than dataclass(slots=True), which needs 3.10
+    __slots__ = ('file', 'line', 'category', 'message', 'severity')
 
-class TypeIssue(NamedTuple):
     file: str
     line: int
     category: str
     message: str
     severity: str  # 'error', 'warning', 'info'
 
+    def to_dict(self) -> dict[str, str | int]:
+        """Return the issue as a plain dict for JSON output."""
+        return {field: getattr(self, field) for field in self.__slots__}
+
+
+# All checks fused into a single pattern that runs over a whole file; the
+# name of the matching group identifies the check. Alternatives sharing a
+# leading character are factored so the regex engine can skip ahead on it,
+# and the assertion only consumes "as" so the "any" in "as any" is still
+# matched on its own. Like universal newlines, "\r\n", "\r" and "\n" all end
+# a line: whitespace is spelled [^\S\r\n] so no check spans a line break,
+# and (?![^\r\n]) anchors at the end of a line. Patterns are ASCII-only and
+# run on raw bytes, so files are never decoded.
+ISSUE_RE = re.compile(
+    rb'a(?:(?<=\ba)(?P<any_usage>ny\b)|(?<=\ba)(?P<type_assertion>s(?=[^\S\r\n]+\w)))'
+    rb'|(?P<ts_ignore>@ts-(?:ignore|expect-error)[^\S\r\n]*(?![^\r\n]))'
+    rb'|(?P<non_null_assertion>![^\S\r\n]*[.;)\]])'
+    rb'|:[^\S\r\n]*(?:(?P<object_type>Object\b)|(?P<function_type>Function\b))'
+)
+LINE_END_RE = re.compile(rb'[\r\n]')
+ANY_IN_COMMENT_RE = re.compile(rb'//.*any|/\*.*any')
+
+# Length of the shortest text any check can match ("!." or "!;")
+MIN_ISSUE_SIZE = 2
+
+# (category, message, severity) per check, in the order issues are reported
+CHECKS = {
+    'any_usage': ('any-usage', 'Explicit use of "any" type', 'warning'),
+    'type_assertion': ('type-assertion', 'Type assertion detected - prefer type guards', 'info'),
+    'ts_ignore': ('ts-ignore', '@ts-ignore/expect-error without explanation', 'warning'),
+    'non_null_assertion': (
+        'non-null-assertion', 'Non-null assertion (!) - consider explicit null check', 'info'
+    ),
+    'object_type': (
+        'object-type', 'Use "object" (lowercase) or specific type instead of "Object"', 'warning'
+    ),
+    'function_type': (
+        'function-type', 'Use specific function signature instead of "Function"', 'warning'
+    ),
+}
+
+# Files handed to a worker process at a time when analyzing in parallel
+CHUNK_SIZE = 32
+
+# Directories never searched for TypeScript sources
+EXCLUDE_DIRS = frozenset({'node_modules', 'dist', 'build', '.next', 'coverage'})
+
 
 def find_typescript_files(path: Path) -> list[Path]:
     """Find all TypeScript files in path."""
@@ -36,82 +100,93 @@ def find_typescript_files(path: Path) -> list[Path]:
         return [path] if path.suffix in ('.ts', '.tsx') else []
 
     files = []
-    for pattern in ('**/*.ts', '**/*.tsx'):
-        files.extend(path.glob(pattern))
-
-    # Exclude common directories
-    exclude = {'node_modules', 'dist', 'build', '.next', 'coverage'}
-    return [f for f in files if not any(ex in f.parts for ex in exclude)]
+    for dirpath, dirnames, filenames in os.walk(path):
+        # Prune excluded directories so they are never descended into
+        dirnames[:] = [d for d in dirnames if d not in EXCLUDE_DIRS]
+        files.extend(Path(dirpath, f) for f in filenames if f.endswith(('.ts', '.tsx')))
+    return files
 
 
 def analyze_file(file_path: Path, strict: bool = False) -> list[TypeIssue]:
     """Analyze a single TypeScript file for type issues."""
     issues = []
-    content = file_path.read_text(encoding='utf-8')
-    lines = content.split('\n')
+    # Files too small to hold a match (this includes empty files, which
+    # mmap refuses) are not worth opening
+    if file_path.stat().st_size < MIN_ISSUE_SIZE:
+        return issues
+
+    with open(file_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            issues = scan_content(file_path, content, strict)
+    return issues
 
-    for line_num, line in enumerate(lines, 1):
-        # Check for explicit 'any' usage
-        if re.search(r'\bany\b', line) and not re.search(r'//.*any|/\*.*any', line):
-            issues.append(TypeIssue(
-                file=str(file_path),
-                line=line_num,
-                category='any-usage',
-                message='Explicit use of "any" type',
-                severity='error' if strict else 'warning'
-            ))
 
-        # Check for type assertions
-        if re.search(r'\bas\s+\w+', line):
-            issues.append(TypeIssue(
-                file=str(file_path),
-                line=line_num,
-                category='type-assertion',
-                message='Type assertion detected - prefer type guards',
-                severity='info'
-            ))
+def scan_content(file_path: Path, content: bytes | mmap.mmap, strict: bool = False) -> list[TypeIssue]:
+    """Run the fused checks over a whole file and report issues per line."""
+    # Checks hit on each line, keyed by the offset the line starts at
+    found_by_line: dict[int, set[str]] = {}
+    line_start = 0
+    for match in ISSUE_RE.finditer(content):
+        # Hits come in order, so only look back as far as the previous line
+        start = match.start()
+        line_start = max(
+            content.rfind(b'\n', line_start, start),
+            content.rfind(b'\r', line_start, start),
+            line_start - 1,
+        ) + 1
+        found_by_line.setdefault(line_start, set()).add(match.lastgroup)
 
-        # Check for @ts-ignore or @ts-expect-error without comment
-        if re.search(r'@ts-(ignore|expect-error)\s*$', line):
+    issues = []
+    line_num = 1
+    counted_to = 0
+    for line_start, found in found_by_line.items():
+        # Count line breaks since the last hit line, "\r\n" only once
+        skipped = content[counted_to:line_start]
+        line_num += skipped.count(b'\n') + skipped.count(b'\r') - skipped.count(b'\r\n')
+        counted_to = line_start
+        line_end = LINE_END_RE.search(content, line_start)
+        line = content[line_start:line_end.start() if line_end else len(content)]
+
+        # 'any' mentioned in a comment and '!' in a comparison are fine
+        if 'any_usage' in found and ANY_IN_COMMENT_RE.search(line):
+            found.discard('any_usage')
+        if 'non_null_assertion' in found and b'!=' in line:
+            found.discard('non_null_assertion')
+
+        for check, (category, message, severity) in CHECKS.items():
+            if check not in found:
+                continue
+            if check == 'any_usage' and strict:
+                severity = 'error'
             issues.append(TypeIssue(
                 file=str(file_path),
                 line=line_num,
-                category='ts-ignore',
-                message='@ts-ignore/expect-error without explanation',
-                severity='warning'
+                category=category,
+                message=message,
+                severity=severity
             ))
 
-        # Check for non-null assertions
-        if re.search(r'!\s*[.;)\]]', line) and '!==' not in line and '!=' not in line:
-            issues.append(TypeIssue(
-                file=str(file_path),
-                line=line_num,
-                category='non-null-assertion',
-                message='Non-null assertion (!) - consider explicit null check',
-                severity='info'
-            ))
+    return issues
 
-        # Check for Object type
-        if re.search(r':\s*Object\b', line):
-            issues.append(TypeIssue(
-                file=str(file_path),
-                line=line_num,
-                category='object-type',
-                message='Use "object" (lowercase) or specific type instead of "Object"',
-                severity='warning'
-            ))
 
-        # Check for Function type
-        if re.search(r':\s*Function\b', line):
-            issues.append(TypeIssue(
-                file=str(file_path),
-                line=line_num,
-                category='function-type',
-                message='Use specific function signature instead of "Function"',
-                severity='warning'
-            ))
+def try_analyze_file(file_path: Path, strict: bool = False) -> tuple[list[TypeIssue], str | None]:
+    """Analyze a file, returning the error message instead of raising."""
+    try:
+        return analyze_file(file_path, strict), None
+    except Exception as e:
+        return [], str(e)
 
-    return issues
+
+def analyze_files(files: list[Path], strict: bool = False) -> list[tuple[list[TypeIssue], str | None]]:
+    """Analyze files across worker processes, returning results in input order."""
+    analyze = partial(try_analyze_file, strict=strict)
+
+    # With one CPU or a single chunk, a pool only adds pickling overhead
+    if len(files) <= CHUNK_SIZE or (os.cpu_count() or 1) == 1:
+        return [analyze(file) for file in files]
+
+    with ProcessPoolExecutor() as executor:
+        return list(executor.map(analyze, files, chunksize=CHUNK_SIZE))
 
 
 def generate_report(issues: list[TypeIssue], files_analyzed: int) -> str:
@@ -120,9 +195,14 @@ def generate_report(issues: list[TypeIssue], files_analyzed: int) -> str:
     report.append(f"**Files analyzed:** {files_analyzed}\n")
     report.append(f"**Total issues:** {len(issues)}\n")
 
-    # Summary by category
-    categories = Counter(issue.category for issue in issues)
-    severity_counts = Counter(issue.severity for issue in issues)
+    # Tally categories and severities and group issues by file in one pass
+    categories: Counter[str] = Counter()
+    severity_counts: Counter[str] = Counter()
+    issues_by_file: dict[str, list[TypeIssue]] = {}
+    for issue in issues:
+        categories[issue.category] += 1
+        severity_counts[issue.severity] += 1
+        issues_by_file.setdefault(issue.file, []).append(issue)
 
     report.append("\n## Summary by Severity\n")
     report.append(f"- Errors: {severity_counts['error']}")
@@ -133,11 +213,6 @@ def generate_report(issues: list[TypeIssue], files_analyzed: int) -> str:
     for category, count in categories.most_common():
         report.append(f"- {category}: {count}")
 
-    # Group issues by file
-    issues_by_file: dict[str, list[TypeIssue]] = {}
-    for issue in issues:
-        issues_by_file.setdefault(issue.file, []).append(issue)
-
     report.append("\n## Issues by File\n")
     for file, file_issues in sorted(issues_by_file.items()):
         report.append(f"\n### `{file}`\n")
@@ -149,6 +224,41 @@ def generate_report(issues: list[TypeIssue], files_analyzed: int) -> str:
     return '\n'.join(report)
 
 
+def dumps(obj: dict) -> str:
+    """Serialize obj as indented JSON, using orjson when available.
+
+    orjson writes non-ASCII text as raw UTF-8 and rejects the surrogate
+    escapes of undecodable file names, so any string outside printable
+    ASCII goes through json, which escapes it. For printable ASCII both
+    produce the same text, so output never depends on orjson.
+    """
+    if orjson is not None and all(
+        value.isascii() and value.isprintable()
+        for value in obj.values() if isinstance(value, str)
+    ):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(obj, indent=2)
+
+
+def write_json(issues: list[TypeIssue], files_analyzed: int, out: TextIO) -> None:
+    """Stream the JSON output one issue at a time.
+
+    Produces the same layout as json.dumps(..., indent=2) on the full
+    document, without building a dict for every issue up front. Each
+    issue is serialized in full before any of it is written, and dumps()
+    falls back to json for anything orjson would reject, so a partial
+    document is never left behind.
+    """
+    out.write('{\n')
+    out.write(f'  "files_analyzed": {files_analyzed},\n')
+    out.write(f'  "total_issues": {len(issues)},\n')
+    out.write('  "issues": [')
+    for i, issue in enumerate(issues):
+        text = dumps(issue.to_dict()).replace('\n', '\n    ')
+        out.write((',\n    ' if i else '\n    ') + text)
+    out.write('\n  ]\n}\n' if issues else ']\n}\n')
+
+
 def main():
     parser = argparse.ArgumentParser(description='Analyze TypeScript files for type issues')
     parser.add_argument('path', nargs='?', default='.', help='Path to analyze')
@@ -168,20 +278,13 @@ def main():
         return 0
 
     all_issues = []
-    for file in files:
-        try:
-            issues = analyze_file(file, args.strict)
-            all_issues.extend(issues)
-        except Exception as e:
-            print(f"Error analyzing {file}: {e}", file=sys.stderr)
+    for file, (issues, error) in zip(files, analyze_files(files, args.strict)):
+        if error is not None:
+            print(f"Error analyzing {file}: {error}", file=sys.stderr)
+        all_issues.extend(issues)
 
     if args.json:
-        output = {
-            'files_analyzed': len(files),
-            'total_issues': len(all_issues),
-            'issues': [issue._asdict() for issue in all_issues]
-        }
-        print(json.dumps(output, indent=2))
+        write_json(all_issues, len(files), sys.stdout)
     elif args.report:
         print(generate_report(all_issues, len(files)))
     else: